@@ -31,6 +31,7 @@ from temporian.implementation.numpy.data.event_set import EventSet
 from temporian.core.graph import infer_graph
 from temporian.core.schedule import Schedule, ScheduleStep
 from temporian.core.operators.leak import LeakOperator
+from temporian.core.operators.scalar.folding import fold_scalar_chains
 
 
 def run(
@@ -232,6 +233,16 @@ def build_schedule(
             # Some of the inputs are missing.
             op_to_num_pending_inputs[op] = num_pending_inputs
 
+    # List the intermediate nodes used by a single operator. This operator can
+    # reuse their data.
+    for node, node_ops in node_to_op.items():
+        if (
+            len(node_ops) == 1
+            and node not in graph.inputs
+            and node not in outputs
+        ):
+            schedule.single_use_nodes.add(node)
+
     # Make evaluation order deterministic.
     #
     # Execute the op with smallest internal ordered id first.
@@ -283,6 +294,8 @@ def build_schedule(
                     del op_to_num_pending_inputs[new_op]
 
     assert not op_to_num_pending_inputs
+
+    fold_scalar_chains(schedule)
     return schedule
 
 
@@ -19,6 +19,8 @@ from __future__ import annotations
 from datetime import datetime
 from typing import TYPE_CHECKING, Any, Dict, List, Literal, Optional, Union
 
+import numpy as np
+
 from temporian.core.data.duration import Duration
 
 if TYPE_CHECKING:
@@ -30,7 +32,8 @@ if TYPE_CHECKING:
         WindowLength,
     )
 
-T_SCALAR = (int, float)
+# Note: Numpy scalars are converted to python values by the scalar operators.
+T_SCALAR = (int, float, np.integer, np.floating)
 
 
 class EventSetOperations:
@@ -611,9 +614,11 @@ class EventSetOperations:
 
         If a scalar, each item in each feature in `self` is divided by `other`.
 
-        This operator cannot be used in features with dtypes `int32` or `int64`.
-        Cast to float before (see example) or use
+        Dividing two EventSets cannot be used in features with dtypes `int32`
+        or `int64`. Cast to float before (see example) or use
         [`EventSet.__floordiv__()`][temporian.EventSet.__floordiv__] instead.
+        Dividing integer features by a scalar returns `float64` features. Cast
+        them to `tp.float32` before to get `float32` features.
 
         See examples in [`EventSet.__add__()`][temporian.EventSet.__add__] to
         see how to match samplings, dtypes and index, in order to apply
@@ -699,6 +704,25 @@ class EventSetOperations:
 
             ```
 
+        Example with scalar value and integer features:
+            ```python
+            >>> a = tp.event_set(
+            ...     timestamps=[1, 2, 3],
+            ...     features={"f1": [0, 100, 200]}
+            ... )
+
+            >>> b = a / 8
+            >>> b
+            indexes: []
+            features: [('f1', float64)]
+            events:
+                (3 events):
+                    timestamps: [1. 2. 3.]
+                    'f1': [ 0. 12.5 25. ]
+            ...
+
+            ```
+
         Args:
             other: EventSet or scalar value.
 
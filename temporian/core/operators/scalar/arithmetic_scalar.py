@@ -14,18 +14,41 @@
 
 """Event/scalar arithmetic operators classes and public API definitions."""
 
-from typing import Union
+import math
+from typing import Any, Optional, Tuple, Type, Union
+
+import numpy as np
 
 from temporian.core import operator_lib
 from temporian.core.compilation import compile
 from temporian.core.data.dtype import DType
 from temporian.core.data.node import EventSetNode
+from temporian.core.data.schema import FeatureSchema
 from temporian.core.operators.scalar.base import (
+    NUMERIC_DTYPES,
     BaseScalarOperator,
 )
 from temporian.core.typing import EventSetOrNode
 
 SCALAR = Union[float, int]
+_SCALAR_TYPES = (float, int, np.floating, np.integer)
+_INTEGER_DTYPES = frozenset({DType.INT32, DType.INT64})
+
+
+def power_of_two_exponent(value: Any) -> Optional[int]:
+    """Gets `n` such that `value` is `2**n` or `-2**n`.
+
+    Returns None if `value` is not a positive or negative power of two.
+    """
+    if isinstance(value, bool) or not isinstance(value, (float, int)):
+        return None
+    try:
+        mantissa, exponent = math.frexp(value)
+    except OverflowError:
+        return None
+    if abs(mantissa) != 0.5:
+        return None
+    return exponent - 1
 
 
 class AddScalarOperator(BaseScalarOperator):
@@ -55,21 +78,50 @@ class PowerScalarOperator(BaseScalarOperator):
 class DivideScalarOperator(BaseScalarOperator):
     DEF_KEY = "DIVISION_SCALAR"
 
-    def __init__(
-        self,
-        input: EventSetNode,
-        value: Union[float, int],
-        is_value_first: bool = False,
-    ):
-        super().__init__(input, value, is_value_first)
+    def compatible_feature_dtypes(
+        self, value: Union[float, int]
+    ) -> Tuple[DType, ...]:
+        # Numpy divides integer features as float64 values, so they can be
+        # divided by float values.
+        return NUMERIC_DTYPES
+
+    def output_feature_dtype(self, feature: FeatureSchema) -> DType:
+        if feature.dtype in _INTEGER_DTYPES:
+            return DType.FLOAT64
+        return feature.dtype
+
+
+def _create_scalar_operator(
+    operator_class: Type[BaseScalarOperator],
+    left: Union[EventSetOrNode, SCALAR],
+    right: Union[EventSetOrNode, SCALAR],
+    function_name: str,
+) -> EventSetNode:
+    """Creates a non-commutative scalar operator.
+
+    The EventSetNode can be on either side of the operation.
+    """
+
+    if isinstance(left, EventSetNode):
+        if isinstance(right, _SCALAR_TYPES):
+            return operator_class(
+                input=left,
+                value=right,
+                is_value_first=False,
+            ).outputs["output"]
+
+    elif isinstance(left, _SCALAR_TYPES) and isinstance(right, EventSetNode):
+        return operator_class(
+            input=right,
+            value=left,
+            is_value_first=True,
+        ).outputs["output"]
 
-        for feat in input.schema.features:
-            if feat.dtype in [DType.INT32, DType.INT64]:
-                raise ValueError(
-                    "Cannot use the divide operator on feature "
-                    f"{feat.name} of type {feat.dtype}. Cast to a "
-                    "floating point type or use floordiv operator (//)."
-                )
+    raise ValueError(
+        f"Invalid input types for {function_name}. "
+        "Expected (EventSetOrNode, SCALAR) or (SCALAR, EventSetOrNode), "
+        f"got ({type(left)}, {type(right)})."
+    )
 
 
 @compile
@@ -90,34 +142,8 @@ def subtract_scalar(
     minuend: Union[EventSetOrNode, SCALAR],
     subtrahend: Union[EventSetOrNode, SCALAR],
 ) -> EventSetOrNode:
-    scalars_types = (float, int)
-
-    if isinstance(minuend, EventSetNode) and isinstance(
-        subtrahend, scalars_types
-    ):
-        assert isinstance(minuend, EventSetNode)
-
-        return SubtractScalarOperator(
-            input=minuend,
-            value=subtrahend,
-            is_value_first=False,
-        ).outputs["output"]
-
-    if isinstance(minuend, scalars_types) and isinstance(
-        subtrahend, EventSetNode
-    ):
-        assert isinstance(subtrahend, EventSetNode)
-
-        return SubtractScalarOperator(
-            input=subtrahend,
-            value=minuend,
-            is_value_first=True,
-        ).outputs["output"]
-
-    raise ValueError(
-        "Invalid input types for subtract_scalar. "
-        "Expected (EventSetOrNode, SCALAR) or (SCALAR, EventSetOrNode), "
-        f"got ({type(minuend)}, {type(subtrahend)})."
+    return _create_scalar_operator(
+        SubtractScalarOperator, minuend, subtrahend, "subtract_scalar"
     )
 
 
@@ -139,34 +165,8 @@ def divide_scalar(
     numerator: Union[EventSetOrNode, SCALAR],
     denominator: Union[EventSetOrNode, SCALAR],
 ) -> EventSetOrNode:
-    scalars_types = (float, int)
-
-    if isinstance(numerator, EventSetNode) and isinstance(
-        denominator, scalars_types
-    ):
-        assert isinstance(numerator, EventSetNode)
-
-        return DivideScalarOperator(
-            input=numerator,
-            value=denominator,
-            is_value_first=False,
-        ).outputs["output"]
-
-    if isinstance(numerator, scalars_types) and isinstance(
-        denominator, EventSetNode
-    ):
-        assert isinstance(denominator, EventSetNode)
-
-        return DivideScalarOperator(
-            input=denominator,
-            value=numerator,
-            is_value_first=True,
-        ).outputs["output"]
-
-    raise ValueError(
-        "Invalid input types for divide_scalar. "
-        "Expected (EventSetOrNode, SCALAR) or (SCALAR, EventSetOrNode), "
-        f"got ({type(numerator)}, {type(denominator)})."
+    return _create_scalar_operator(
+        DivideScalarOperator, numerator, denominator, "divide_scalar"
     )
 
 
@@ -175,34 +175,8 @@ def floordiv_scalar(
     numerator: Union[EventSetOrNode, SCALAR],
     denominator: Union[EventSetOrNode, SCALAR],
 ) -> EventSetOrNode:
-    scalars_types = (float, int)
-
-    if isinstance(numerator, EventSetNode) and isinstance(
-        denominator, scalars_types
-    ):
-        assert isinstance(numerator, EventSetNode)
-
-        return FloorDivScalarOperator(
-            input=numerator,
-            value=denominator,
-            is_value_first=False,
-        ).outputs["output"]
-
-    if isinstance(numerator, scalars_types) and isinstance(
-        denominator, EventSetNode
-    ):
-        assert isinstance(denominator, EventSetNode)
-
-        return FloorDivScalarOperator(
-            input=denominator,
-            value=numerator,
-            is_value_first=True,
-        ).outputs["output"]
-
-    raise ValueError(
-        "Invalid input types for floordiv_scalar. "
-        "Expected (EventSetOrNode, SCALAR) or (SCALAR, EventSetOrNode), "
-        f"got ({type(numerator)}, {type(denominator)})."
+    return _create_scalar_operator(
+        FloorDivScalarOperator, numerator, denominator, "floordiv_scalar"
     )
 
 
@@ -211,34 +185,8 @@ def modulo_scalar(
     numerator: Union[EventSetOrNode, SCALAR],
     denominator: Union[EventSetOrNode, SCALAR],
 ) -> EventSetOrNode:
-    scalar_types = (float, int)
-
-    if isinstance(numerator, EventSetNode) and isinstance(
-        denominator, scalar_types
-    ):
-        assert isinstance(numerator, EventSetNode)
-
-        return ModuloScalarOperator(
-            input=numerator,
-            value=denominator,
-            is_value_first=False,
-        ).outputs["output"]
-
-    if isinstance(numerator, scalar_types) and isinstance(
-        denominator, EventSetNode
-    ):
-        assert isinstance(denominator, EventSetNode)
-
-        return ModuloScalarOperator(
-            input=denominator,
-            value=numerator,
-            is_value_first=True,
-        ).outputs["output"]
-
-    raise ValueError(
-        "Invalid input types for modulo_scalar. "
-        "Expected (EventSetOrNode, SCALAR) or (SCALAR, EventSetOrNode), "
-        f"got ({type(numerator)}, {type(denominator)})."
+    return _create_scalar_operator(
+        ModuloScalarOperator, numerator, denominator, "modulo_scalar"
     )
 
 
@@ -247,30 +195,8 @@ def power_scalar(
     base: Union[EventSetOrNode, SCALAR],
     exponent: Union[EventSetOrNode, SCALAR],
 ) -> EventSetOrNode:
-    scalar_types = (float, int)
-
-    if isinstance(base, EventSetNode) and isinstance(exponent, scalar_types):
-        assert isinstance(base, EventSetNode)
-
-        return PowerScalarOperator(
-            input=base,
-            value=exponent,
-            is_value_first=False,
-        ).outputs["output"]
-
-    if isinstance(base, scalar_types) and isinstance(exponent, EventSetNode):
-        assert isinstance(exponent, EventSetNode)
-
-        return PowerScalarOperator(
-            input=exponent,
-            value=base,
-            is_value_first=True,
-        ).outputs["output"]
-
-    raise ValueError(
-        "Invalid input types for power_scalar. "
-        "Expected (EventSetOrNode, SCALAR) or (SCALAR, EventSetOrNode), "
-        f"got ({type(base)}, {type(exponent)})."
+    return _create_scalar_operator(
+        PowerScalarOperator, base, exponent, "power_scalar"
     )
 
 
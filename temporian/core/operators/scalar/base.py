@@ -14,7 +14,9 @@
 
 """Base scalar operator class definition."""
 
-from typing import Union, List
+from typing import Dict, Tuple, Type, Union
+
+import numpy as np
 
 from temporian.core.data.dtype import DType
 from temporian.core.data.node import (
@@ -25,6 +27,35 @@ from temporian.core.data.schema import FeatureSchema
 from temporian.core.operators.base import Operator
 from temporian.proto import core_pb2 as pb
 
+NUMERIC_DTYPES = (
+    DType.FLOAT32,
+    DType.FLOAT64,
+    DType.INT32,
+    DType.INT64,
+)
+
+# Feature dtypes that can be combined with a value of a given python type
+# without upcasting the feature.
+_VALUE_TYPE_TO_FEATURE_DTYPES: Dict[type, Tuple[DType, ...]] = {
+    float: (DType.FLOAT32, DType.FLOAT64),
+    int: (DType.INT32, DType.INT64, DType.FLOAT32, DType.FLOAT64),
+    str: (DType.STRING,),
+    bytes: (DType.STRING,),
+    bool: (
+        DType.BOOLEAN,
+        DType.INT32,
+        DType.INT64,
+        DType.FLOAT32,
+        DType.FLOAT64,
+    ),
+}
+
+# Operator definitions indexed by operator class.
+#
+# All the instances of a class share the same definition object, which is
+# returned by `Operator.definition`. This definition must not be modified.
+_OP_DEFINITIONS: Dict[Type[Operator], pb.OperatorDef] = {}
+
 
 class BaseScalarOperator(Operator):
     """Interface definition and common code for scalar operators."""
@@ -39,6 +70,11 @@ class BaseScalarOperator(Operator):
     ):
         super().__init__()
 
+        if isinstance(value, np.generic):
+            # Numpy scalars (e.g., np.float32, np.int64) are not supported as
+            # attributes. Note: np.float64 is a subclass of float.
+            value = value.item()
+
         if isinstance(value, str):
             value = value.encode()
 
@@ -68,27 +104,15 @@ class BaseScalarOperator(Operator):
 
         # Check that the feature dtype doesn't need an upcast to operate with
         # this value type
-        self.map_vtype_dtype = {
-            float: [DType.FLOAT32, DType.FLOAT64],
-            int: [DType.INT32, DType.INT64, DType.FLOAT32, DType.FLOAT64],
-            str: [DType.STRING],
-            bytes: [DType.STRING],
-            bool: [
-                DType.BOOLEAN,
-                DType.INT32,
-                DType.INT64,
-                DType.FLOAT32,
-                DType.FLOAT64,
-            ],
-        }
         if not self.ignore_value_dtype_checking:
+            compatible_dtypes = self.compatible_feature_dtypes(value)
             for feature in input.schema.features:
-                if feature.dtype not in self.map_vtype_dtype[type(value)]:
+                if feature.dtype not in compatible_dtypes:
                     raise ValueError(
                         f"Cannot add feature '{feature.name}'"
                         f" (dtype {feature.dtype}) with value '{value}'"
                         f" of type {type(value)}. Use cast() to convert the"
-                        f" feature to {self.map_vtype_dtype[type(value)]}"
+                        f" feature to {list(compatible_dtypes)}"
                         " first, or change the value type."
                     )
 
@@ -113,6 +137,16 @@ class BaseScalarOperator(Operator):
 
     @classmethod
     def build_op_definition(cls) -> pb.OperatorDef:
+        # The definition only depends on the class. It is built once instead
+        # of for each operator instance.
+        definition = _OP_DEFINITIONS.get(cls)
+        if definition is None:
+            definition = cls._build_op_definition()
+            _OP_DEFINITIONS[cls] = definition
+        return definition
+
+    @classmethod
+    def _build_op_definition(cls) -> pb.OperatorDef:
         return pb.OperatorDef(
             key=cls.operator_def_key(),
             attributes=[
@@ -139,14 +173,15 @@ class BaseScalarOperator(Operator):
         return cls.DEF_KEY
 
     @property
-    def supported_value_dtypes(self) -> List[DType]:
+    def supported_value_dtypes(self) -> Tuple[DType, ...]:
         """Supported DTypes for value."""
-        return [
-            DType.FLOAT32,
-            DType.FLOAT64,
-            DType.INT32,
-            DType.INT64,
-        ]
+        return NUMERIC_DTYPES
+
+    def compatible_feature_dtypes(
+        self, value: Union[float, int, bytes, bool]
+    ) -> Tuple[DType, ...]:
+        """Feature DTypes that can be combined with `value`."""
+        return _VALUE_TYPE_TO_FEATURE_DTYPES[type(value)]
 
     def output_feature_dtype(self, feature: FeatureSchema) -> DType:
         return feature.dtype
@@ -0,0 +1,144 @@
+# Copyright 2021 Google LLC.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Folding of chains of scalar operators in a schedule."""
+
+from typing import Dict, List, Optional
+
+from temporian.core.data.dtype import DType
+from temporian.core.data.node import EventSetNode
+from temporian.core.operators.base import Operator
+from temporian.core.operators.scalar.arithmetic_scalar import (
+    _INTEGER_DTYPES,
+    DivideScalarOperator,
+    SubtractScalarOperator,
+    power_of_two_exponent,
+)
+from temporian.core.schedule import Schedule, ScheduleStep
+
+# Largest exponent of the merged power of two divisor. Integer features
+# divided by up to 2**64 stay far above the smallest normal float64 number.
+_MAX_DIVISOR_EXPONENT = 64
+
+
+def fold_scalar_chains(schedule: Schedule) -> None:
+    """Merges chains of subtract and divide scalar operators in a schedule.
+
+    `(x - a) - b` is computed as `x - (a + b)`, and `(x / a) / b` as
+    `x / (a * b)`, so the features are processed once instead of once per
+    operator. Only chains whose intermediate results are not used anywhere
+    else, and for which the merged operator gives the same results, are
+    merged.
+    """
+
+    steps: List[Optional[ScheduleStep]] = []
+    # Index in "steps" of the step computing each node.
+    node_to_step_idx: Dict[EventSetNode, int] = {}
+
+    for step in schedule.steps:
+        op = step.op
+        if isinstance(op, (SubtractScalarOperator, DivideScalarOperator)):
+            input_node = op.inputs["input"]
+            prev_step_idx = node_to_step_idx.get(input_node)
+            if (
+                prev_step_idx is not None
+                and input_node in schedule.single_use_nodes
+            ):
+                prev_step = steps[prev_step_idx]
+                assert prev_step is not None
+                folded_op = _fold_scalar_operators(prev_step.op, op)
+                if folded_op is not None:
+                    # The folded operator computes the output of "op" from the
+                    # input of the previous operator. The intermediate node is
+                    # never computed.
+                    #
+                    # Note: The output node keeps "op" as its `creator`, so
+                    # `node.creator` can differ from the operator of the step
+                    # computing the node. Both operators have the same class,
+                    # which is all that code selecting implementations through
+                    # `node.creator` relies on. The output node created by the
+                    # constructor of the folded operator is not used.
+                    folded_op.outputs = op.outputs
+                    step = ScheduleStep(
+                        op=folded_op,
+                        released_nodes=prev_step.released_nodes
+                        + [
+                            n
+                            for n in step.released_nodes
+                            if n is not input_node
+                        ],
+                    )
+                    steps[prev_step_idx] = None
+                    del node_to_step_idx[input_node]
+                    schedule.single_use_nodes.discard(input_node)
+
+        for output in step.op.outputs.values():
+            node_to_step_idx[output] = len(steps)
+        steps.append(step)
+
+    schedule.steps = [step for step in steps if step is not None]
+
+
+def _fold_scalar_operators(
+    first: Operator, second: Operator
+) -> Optional[Operator]:
+    """Creates an operator equivalent to applying `first` then `second`.
+
+    Returns None if the operators cannot be merged without changing the
+    results.
+    """
+
+    if (
+        type(first) is not type(second)
+        or first.is_value_first
+        or second.is_value_first
+    ):
+        return None
+
+    input = first.inputs["input"]
+    dtypes = {feature.dtype for feature in input.schema.features}
+    if not dtypes <= _INTEGER_DTYPES:
+        # Floating point subtractions are not associative, and floating point
+        # divisions can overflow or lose precision in the subnormal range.
+        return None
+
+    if isinstance(first, SubtractScalarOperator):
+        # Integer subtractions are exact, including on overflow, as long as
+        # the values fit in the feature dtypes.
+        bits = 32 if DType.INT32 in dtypes else 64
+        value_range = range(-(2 ** (bits - 1)), 2 ** (bits - 1))
+        values = [first.value, second.value]
+        if not all(isinstance(v, int) and v in value_range for v in values):
+            return None
+        value = first.value + second.value
+        if value not in value_range:
+            return None
+        return SubtractScalarOperator(input=input, value=value)
+
+    assert isinstance(first, DivideScalarOperator)
+    # The integer features are divided as float64 values. A non zero integer
+    # divided by a power of two larger than one, and up to
+    # 2**_MAX_DIVISOR_EXPONENT, is a normal number. Those divisions are exact,
+    # so dividing twice or by the product gives the same result.
+    first_exponent = power_of_two_exponent(first.value)
+    second_exponent = power_of_two_exponent(second.value)
+    if (
+        first_exponent is None
+        or second_exponent is None
+        or first_exponent < 0
+        or second_exponent < 0
+        or first_exponent + second_exponent > _MAX_DIVISOR_EXPONENT
+    ):
+        return None
+    return DivideScalarOperator(input=input, value=first.value * second.value)
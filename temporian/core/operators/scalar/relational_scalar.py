@@ -14,7 +14,7 @@
 
 """Event/scalar relational operators classes and public API definitions."""
 
-from typing import Union, List
+from typing import Tuple, Union
 
 from temporian.core import operator_lib
 from temporian.core.compilation import compile
@@ -26,6 +26,15 @@ from temporian.core.operators.scalar.base import (
 )
 from temporian.core.typing import EventSetOrNode
 
+_SUPPORTED_VALUE_DTYPES = (
+    DType.FLOAT32,
+    DType.FLOAT64,
+    DType.INT32,
+    DType.INT64,
+    DType.BOOLEAN,
+    DType.STRING,
+)
+
 
 class RelationalScalarOperator(BaseScalarOperator):
     DEF_KEY = ""
@@ -35,15 +44,8 @@ class RelationalScalarOperator(BaseScalarOperator):
         return DType.BOOLEAN
 
     @property
-    def supported_value_dtypes(self) -> List[DType]:
-        return [
-            DType.FLOAT32,
-            DType.FLOAT64,
-            DType.INT32,
-            DType.INT64,
-            DType.BOOLEAN,
-            DType.STRING,
-        ]
+    def supported_value_dtypes(self) -> Tuple[DType, ...]:
+        return _SUPPORTED_VALUE_DTYPES
 
     @classmethod
     def operator_def_key(cls) -> str:
@@ -12,11 +12,30 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import os
+import signal
+import unittest
+from unittest.mock import patch
+
 import numpy as np
 from absl.testing import absltest
+
+import temporian as tp
+from temporian.core.operators.scalar import subtract_scalar
 from temporian.implementation.numpy.data.io import event_set
+from temporian.implementation.numpy.operators import batching
+from temporian.implementation.numpy.operators.scalar import (
+    base as scalar_base,
+)
+from temporian.implementation.numpy.operators.base import (
+    OperatorImplementation,
+)
+from temporian.implementation.numpy.operators.scalar.arithmetic_scalar import (
+    MultiplyScalarNumpyImplementation,
+    SubtractScalarNumpyImplementation,
+)
 
-from temporian.test.utils import f64, assertOperatorResult
+from temporian.test.utils import f32, f64, i32, assertOperatorResult
 
 
 class ArithmeticScalarTest(absltest.TestCase):
@@ -64,6 +83,27 @@ class ArithmeticScalarTest(absltest.TestCase):
         )
         assertOperatorResult(self, value - self.evset, expected)
 
+    def test_subtraction_invalid_types(self) -> None:
+        """Test subtraction operator without a scalar operand."""
+        with self.assertRaisesRegex(
+            ValueError, "Invalid input types for subtract_scalar"
+        ):
+            subtract_scalar(self.evset, self.evset)
+
+    def test_subtraction_numpy_scalar(self) -> None:
+        """Test correct subtraction operator with numpy scalar values."""
+        expected = event_set(
+            timestamps=[1, 2, 3, 4, 5],
+            features={"sales": f64([0, -10, 2, np.nan, 20])},
+            same_sampling_as=self.evset,
+        )
+        for value in [np.float64(10), np.float32(10), np.int64(10)]:
+            assertOperatorResult(self, self.evset - value, expected)
+            assertOperatorResult(
+                self, subtract_scalar(self.evset, value), expected
+            )
+            assertOperatorResult(self, -(value - self.evset), expected)
+
     def test_correct_multiplication(self) -> None:
         """Test correct multiplication operator."""
         value = 10.0
@@ -84,6 +124,85 @@ class ArithmeticScalarTest(absltest.TestCase):
         )
         assertOperatorResult(self, self.evset / value, expected)
 
+    def test_correct_division_power_of_two(self) -> None:
+        """Test correct division operator with a power of two value."""
+        for value in [4, 0.25, -2.0]:
+            expected = event_set(
+                timestamps=[1, 2, 3, 4, 5],
+                features={"sales": f64([10, 0, 12, np.nan, 30]) / value},
+                same_sampling_as=self.evset,
+            )
+            result = self.evset / value
+            assertOperatorResult(self, result, expected)
+            # Multiplying by the reciprocal is exact.
+            np.testing.assert_array_equal(
+                result.get_index_value(()).features[0],
+                expected.get_index_value(()).features[0],
+            )
+
+        evset_f32 = event_set(
+            timestamps=[1, 2, 3],
+            features={"sales": f32([10, 1, 3])},
+        )
+        expected = event_set(
+            timestamps=[1, 2, 3],
+            features={"sales": f32([5, 0.5, 1.5])},
+            same_sampling_as=evset_f32,
+        )
+        assertOperatorResult(self, evset_f32 / 2, expected)
+
+    def test_division_integer_feature(self) -> None:
+        """Test division operator on integer features."""
+        evset = event_set(
+            timestamps=[1, 2, 3],
+            features={
+                "a": [1.0, 2.0, 3.0],
+                "b": [1, 2, 3],
+                "c": i32([4, 5, 6]),
+            },
+        )
+        expected = event_set(
+            timestamps=[1, 2, 3],
+            features={
+                "a": [0.5, 1.0, 1.5],
+                "b": [0.5, 1.0, 1.5],
+                "c": [2.0, 2.5, 3.0],
+            },
+            same_sampling_as=evset,
+        )
+        assertOperatorResult(self, evset / 2, expected)
+
+        expected = event_set(
+            timestamps=[1, 2, 3],
+            features={
+                "a": [4.0, 2.0, 4 / 3],
+                "b": [4.0, 2.0, 4 / 3],
+                "c": [1.0, 0.8, 4 / 6],
+            },
+            same_sampling_as=evset,
+        )
+        assertOperatorResult(self, 4 / evset, expected)
+
+    def test_division_integer_feature_float_value(self) -> None:
+        """Test division operator on integer features with a float value."""
+        evset = event_set(
+            timestamps=[1, 2, 3],
+            features={"a": [1, 2, 5], "b": i32([4, 5, 10])},
+        )
+        expected = event_set(
+            timestamps=[1, 2, 3],
+            features={"a": [0.4, 0.8, 2.0], "b": [1.6, 2.0, 4.0]},
+            same_sampling_as=evset,
+        )
+        assertOperatorResult(self, evset / 2.5, expected)
+
+        expected = event_set(
+            timestamps=[1, 2, 3],
+            features={"a": [2.5, 1.25, 0.5], "b": [0.625, 0.5, 0.25]},
+            same_sampling_as=evset,
+        )
+        assertOperatorResult(self, 2.5 / evset, expected)
+
     def test_correct_division_with_value_as_numerator(self) -> None:
         """Test correct division operator with value as numerator."""
         value = 10.0
@@ -220,6 +339,288 @@ class ArithmeticScalarTest(absltest.TestCase):
         # value first
         assertOperatorResult(self, value + self.evset, expected)
 
+    def test_subtraction_multi_index_multi_feature(self) -> None:
+        """Test correct subtraction operator with multiple features and index
+        keys of different sizes."""
+
+        evset_index = event_set(
+            timestamps=[1, 2, 3, 4, 5, 6],
+            features={
+                "store_id": [0, 1, 1, 2, 2, 2],
+                "sales": f64([10, 0, 12, np.nan, 30, 5]),
+                "count": [1, 2, 3, 4, 5, 6],
+            },
+            indexes=["store_id"],
+        )
+
+        expected = event_set(
+            timestamps=[1, 2, 3, 4, 5, 6],
+            features={
+                "store_id": [0, 1, 1, 2, 2, 2],
+                "sales": f64([0, -10, 2, np.nan, 20, -5]),
+                "count": [-9, -8, -7, -6, -5, -4],
+            },
+            indexes=["store_id"],
+            same_sampling_as=evset_index,
+        )
+        # 6 feature arrays are too few to be batched.
+        self.assertFalse(batching.use_batching(evset_index))
+        assertOperatorResult(self, evset_index - 10, expected)
+
+        # Batch the 3 index keys and 2 features together.
+        with patch.object(batching, "MIN_BATCH_NUM_ARRAYS", 2):
+            self.assertTrue(batching.use_batching(evset_index))
+            assertOperatorResult(self, evset_index - 10, expected)
+
+    def test_multiplication_mixed_dtype_features(self) -> None:
+        """Test correct multiplication operator with interleaved features of
+        different dtypes."""
+
+        evset = event_set(
+            timestamps=[1, 2, 3],
+            features={
+                "a": f64([1, 2, 3]),
+                "b": [1, 2, 3],
+                "c": f32([4, 5, 6]),
+                "d": f64([7, 8, 9]),
+                "e": [4, 5, 6],
+            },
+        )
+
+        expected = event_set(
+            timestamps=[1, 2, 3],
+            features={
+                "a": f64([2, 4, 6]),
+                "b": [2, 4, 6],
+                "c": f32([8, 10, 12]),
+                "d": f64([14, 16, 18]),
+                "e": [8, 10, 12],
+            },
+            same_sampling_as=evset,
+        )
+        assertOperatorResult(self, evset * 2, expected)
+
+        # Batch the features of each dtype together.
+        with patch.object(batching, "MIN_BATCH_NUM_ARRAYS", 1):
+            self.assertTrue(batching.use_batching(evset))
+            assertOperatorResult(self, evset * 2, expected)
+
+    def test_use_batching_per_dtype(self) -> None:
+        """Test the number of feature arrays needed to batch EventSets with
+        several feature dtypes."""
+
+        def make_evset(dtypes):
+            return event_set(
+                timestamps=[1, 2, 3],
+                features={
+                    f"f{idx}": np.array([1, 2, 3], dtype=dtype)
+                    for idx, dtype in enumerate(dtypes)
+                },
+            )
+
+        self.assertTrue(batching.use_batching(make_evset([np.float64] * 16)))
+        self.assertFalse(
+            batching.use_batching(make_evset([np.float64, np.int64] * 8))
+        )
+        self.assertTrue(
+            batching.use_batching(make_evset([np.float64, np.int64] * 16))
+        )
+
+    def test_subtraction_large_index_keys(self) -> None:
+        """Test correct subtraction operator with multiple large index keys."""
+
+        num_events = 1000
+        store_id = np.arange(num_events) % 2
+        sales = np.arange(num_events, dtype=np.float64)
+
+        evset_index = event_set(
+            timestamps=np.arange(num_events),
+            features={"store_id": store_id, "sales": sales},
+            indexes=["store_id"],
+        )
+
+        expected = event_set(
+            timestamps=np.arange(num_events),
+            features={"store_id": store_id, "sales": sales - 10},
+            indexes=["store_id"],
+            same_sampling_as=evset_index,
+        )
+        assertOperatorResult(self, evset_index - 10.0, expected)
+
+    @patch.object(batching, "MIN_PARALLEL_NUM_EVENTS", 0)
+    @patch.object(batching, "_cpu_count", 4)
+    @patch.object(
+        scalar_base,
+        "parallel_map",
+        autospec=True,
+        side_effect=batching.parallel_map,
+    )
+    def test_subtraction_parallel_index_keys(self, parallel_map_mock) -> None:
+        """Test correct subtraction operator with index keys processed in
+        parallel."""
+
+        num_events = 10000
+        store_id = np.arange(num_events) % 10
+        sales = np.arange(num_events, dtype=np.float64)
+
+        evset_index = event_set(
+            timestamps=np.arange(num_events),
+            features={"store_id": store_id, "sales": sales},
+            indexes=["store_id"],
+        )
+
+        expected = event_set(
+            timestamps=np.arange(num_events),
+            features={"store_id": store_id, "sales": sales - 10},
+            indexes=["store_id"],
+            same_sampling_as=evset_index,
+        )
+        assertOperatorResult(self, evset_index - 10.0, expected)
+        parallel_map_mock.assert_called_once()
+
+    @unittest.skipUnless(hasattr(os, "fork"), "Requires os.fork()")
+    @patch.object(batching, "MIN_PARALLEL_NUM_EVENTS", 0)
+    @patch.object(batching, "_cpu_count", 4)
+    def test_subtraction_parallel_index_keys_after_fork(self) -> None:
+        """Test subtraction operator with index keys processed in parallel in
+        a forked process."""
+
+        num_events = 1000
+        store_id = np.arange(num_events) % 10
+        evset_index = event_set(
+            timestamps=np.arange(num_events),
+            features={"store_id": store_id, "sales": np.zeros(num_events)},
+            indexes=["store_id"],
+        )
+
+        # Creates the thread pool in the parent process.
+        _ = evset_index - 10.0
+        self.assertIsNotNone(batching._thread_pool)
+
+        pid = os.fork()
+        if pid == 0:
+            # Child process. Kills itself if the operator hangs.
+            exit_code = 1
+            try:
+                signal.alarm(30)
+                # The CPU count is read again in the child process.
+                batching._cpu_count = 4
+                result = evset_index - 10.0
+                if batching.use_parallel(evset_index) and all(
+                    np.all(index_data.features[0] == -10.0)
+                    for index_data in result.data.values()
+                ):
+                    exit_code = 0
+            finally:
+                os._exit(exit_code)
+
+        _, status = os.waitpid(pid, 0)
+        self.assertTrue(os.WIFEXITED(status))
+        self.assertEqual(os.WEXITSTATUS(status), 0)
+
+    @patch.object(
+        SubtractScalarNumpyImplementation,
+        "enable_input_reuse",
+        autospec=True,
+        side_effect=OperatorImplementation.enable_input_reuse,
+    )
+    def test_subtraction_reuse_input(self, enable_input_reuse_mock) -> None:
+        """Test correct subtraction operator written in the feature arrays of
+        an intermediate result."""
+        multiply_results = _ResultRecorder(MultiplyScalarNumpyImplementation)
+        subtract_results = _ResultRecorder(SubtractScalarNumpyImplementation)
+        node = self.evset.node()
+        with multiply_results, subtract_results:
+            result = ((node * 2.0) - 10.0).run({node: self.evset})
+
+        expected = event_set(
+            timestamps=[1, 2, 3, 4, 5],
+            features={"sales": f64([10, -10, 14, np.nan, 50])},
+            same_sampling_as=self.evset,
+        )
+        assertOperatorResult(self, result, expected)
+        enable_input_reuse_mock.assert_called_once()
+        self.assertTrue(
+            np.shares_memory(
+                multiply_results.results[0], subtract_results.results[0]
+            )
+        )
+
+    @patch.object(
+        SubtractScalarNumpyImplementation,
+        "enable_input_reuse",
+        autospec=True,
+        side_effect=OperatorImplementation.enable_input_reuse,
+    )
+    def test_subtraction_reuse_input_out_of_range_value(
+        self, enable_input_reuse_mock
+    ) -> None:
+        """Test subtraction operator with a value that does not fit in the
+        dtype of the reused feature arrays."""
+        evset = event_set(timestamps=[1, 2], features={"a": i32([1, 2])})
+        node = evset.node()
+        with self.assertRaisesRegex(
+            RuntimeError, "Feature dtypes in outputs don't match"
+        ):
+            ((node * 2) - 2**40).run({node: evset})
+        with self.assertRaisesRegex(
+            RuntimeError, "Feature dtypes in outputs don't match"
+        ):
+            (2**40 - (node * 2)).run({node: evset})
+        self.assertEqual(enable_input_reuse_mock.call_count, 2)
+
+    def test_subtraction_no_reuse_shared_input(self) -> None:
+        """Test subtraction operator on nodes whose feature arrays are used
+        elsewhere."""
+        node = self.evset.node()
+        doubled = node * 2.0
+        renamed = doubled.rename("renamed")
+        results = tp.run(
+            [node - 10.0, doubled - 10.0, doubled, renamed],
+            {node: self.evset},
+        )
+
+        np.testing.assert_array_equal(
+            self.evset.get_index_value(()).features[0],
+            f64([10, 0, 12, np.nan, 30]),
+        )
+        np.testing.assert_array_equal(
+            results[1].get_index_value(()).features[0],
+            f64([10, -10, 14, np.nan, 50]),
+        )
+        for evset in results[2:]:
+            np.testing.assert_array_equal(
+                evset.get_index_value(()).features[0],
+                f64([20, 0, 24, np.nan, 60]),
+            )
+
+
+class _ResultRecorder:
+    """Records the arrays returned by `_do_operation` of an implementation."""
+
+    def __init__(self, implementation_class) -> None:
+        self.results = []
+        original = implementation_class._do_operation
+
+        def do_operation(implementation, *args, **kwargs):
+            result = original(implementation, *args, **kwargs)
+            self.results.append(result)
+            return result
+
+        self._patch = patch.object(
+            implementation_class,
+            "_do_operation",
+            autospec=True,
+            side_effect=do_operation,
+        )
+
+    def __enter__(self) -> "_ResultRecorder":
+        self._patch.start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self._patch.stop()
+
 
 if __name__ == "__main__":
     absltest.main()
@@ -31,3 +31,8 @@ class ScheduleStep:
 class Schedule:
     steps: List[ScheduleStep] = field(default_factory=list)
     input_nodes: Set[EventSetNode] = field(default_factory=set)
+
+    # Nodes used as input by a single operator, excluding the input and output
+    # nodes of the schedule. The data of those nodes is not visible from
+    # anywhere else once this operator is executed.
+    single_use_nodes: Set[EventSetNode] = field(default_factory=set)
@@ -12,10 +12,24 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from unittest.mock import patch
+
 from absl.testing import absltest
 
+import numpy as np
+
 from temporian.core import evaluation
+from temporian.core.operators.scalar import (
+    DivideScalarOperator,
+    SubtractScalarOperator,
+)
 from temporian.core.test import utils
+from temporian.implementation.numpy.operators.base import (
+    OperatorImplementation,
+)
+from temporian.implementation.numpy.operators.scalar.arithmetic_scalar import (
+    SubtractScalarNumpyImplementation,
+)
 from temporian.implementation.numpy.data.event_set import EventSet
 
 import temporian as tp
@@ -85,6 +99,7 @@ class EvaluationTest(absltest.TestCase):
                 evaluation.ScheduleStep(op=o5, released_nodes=[]),
             ],
         )
+        self.assertEqual(schedule.single_use_nodes, {o2.outputs["output"]})
 
     def test_schedule_mid_chain(self):
         i1 = utils.create_input_node()
@@ -108,6 +123,7 @@ class EvaluationTest(absltest.TestCase):
                 ),
             ],
         )
+        self.assertEqual(schedule.single_use_nodes, {o4.outputs["output"]})
 
     def test_schedule_interm_results(self):
         i1 = utils.create_input_node()
@@ -125,6 +141,7 @@ class EvaluationTest(absltest.TestCase):
                 evaluation.ScheduleStep(op=o3, released_nodes=[]),
             ],
         )
+        self.assertEqual(schedule.single_use_nodes, set())
 
     def test_run_value(self):
         i1 = utils.create_input_node()
@@ -222,6 +239,167 @@ class EvaluationTest(absltest.TestCase):
         self.assertFalse(tp.has_leak(e, c))
         self.assertFalse(tp.has_leak(e, d))
 
+    def test_schedule_fold_subtract_scalar(self):
+        a = tp.input_node([("f", tp.int64)])
+        b = a - 1
+        c = b - 2
+        d = c - 3
+
+        schedule = evaluation.build_schedule(inputs={a}, outputs={d})
+
+        self.assertLen(schedule.steps, 1)
+        op = schedule.steps[0].op
+        self.assertIsInstance(op, SubtractScalarOperator)
+        self.assertEqual(op.value, 6)
+        self.assertIs(op.inputs["input"], a)
+        self.assertIs(op.outputs["output"], d)
+        self.assertEqual(schedule.steps[0].released_nodes, [a])
+
+        evset = tp.event_set(timestamps=[1, 2], features={"f": [10, 20]})
+        result = d.run({a: evset})
+        np.testing.assert_array_equal(
+            result.get_index_value(()).features[0], [4, 14]
+        )
+
+    def test_schedule_fold_divide_scalar(self):
+        a = tp.input_node([("f", tp.int64)])
+        b = a / 2
+        c = b / 4
+
+        schedule = evaluation.build_schedule(inputs={a}, outputs={c})
+
+        self.assertLen(schedule.steps, 1)
+        op = schedule.steps[0].op
+        self.assertIsInstance(op, DivideScalarOperator)
+        self.assertEqual(op.value, 8)
+        self.assertIs(op.outputs["output"], c)
+
+        evset = tp.event_set(timestamps=[1, 2], features={"f": [10, 20]})
+        result = c.run({a: evset})
+        np.testing.assert_array_equal(
+            result.get_index_value(()).features[0], [1.25, 2.5]
+        )
+
+        # The float divisors are powers of two larger than one.
+        schedule = evaluation.build_schedule(
+            inputs={a}, outputs={(a / 2.0) / -4.0}
+        )
+        self.assertLen(schedule.steps, 1)
+        self.assertEqual(schedule.steps[0].op.value, -8.0)
+
+    def test_schedule_fold_keeps_creator(self):
+        a = tp.input_node([("f", tp.int64)])
+        b = (a / 2) / 4
+        c = b - 1.0
+
+        schedule = evaluation.build_schedule(inputs={a}, outputs={c})
+
+        # The output node of the folded operator is still created by the
+        # unfolded operator.
+        self.assertLen(schedule.steps, 2)
+        folded_op = schedule.steps[0].op
+        self.assertIs(folded_op.outputs["output"], b)
+        self.assertIsNot(b.creator, folded_op)
+        self.assertIs(type(b.creator), type(folded_op))
+        self.assertEqual(b.creator.value, 4)
+        self.assertIn(b, schedule.single_use_nodes)
+
+        # The subtraction writes its result in the arrays of the folded
+        # division.
+        evset = tp.event_set(timestamps=[1, 2], features={"f": [8, 16]})
+        with patch.object(
+            SubtractScalarNumpyImplementation,
+            "enable_input_reuse",
+            autospec=True,
+            side_effect=OperatorImplementation.enable_input_reuse,
+        ) as enable_input_reuse_mock:
+            result = c.run({a: evset})
+        enable_input_reuse_mock.assert_called_once()
+        np.testing.assert_array_equal(
+            result.get_index_value(()).features[0], [0.0, 1.0]
+        )
+
+    def test_schedule_fold_divide_scalar_large_values(self):
+        a = tp.input_node([("f", tp.int64)])
+        evset = tp.event_set(
+            timestamps=[1, 2, 3],
+            features={"f": [np.iinfo(np.int64).max, np.iinfo(np.int64).min, 1]},
+        )
+        b = a / 2**32
+        c = b / 2**32
+        schedule = evaluation.build_schedule(inputs={a}, outputs={c})
+        self.assertLen(schedule.steps, 1)
+        folded = c.run({a: evset})
+        # The intermediate result is an output, so the chain is not folded.
+        unfolded, _ = tp.run([c, b], {a: evset})
+        np.testing.assert_array_equal(
+            folded.get_index_value(()).features[0],
+            unfolded.get_index_value(()).features[0],
+        )
+
+        # Values near the largest and smallest float numbers.
+        b = tp.input_node([("f", tp.float32)])
+        evset = tp.event_set(
+            timestamps=[1, 2],
+            features={"f": np.array([3e38, -1e-45], dtype=np.float32)},
+        )
+        c = (b / 0.5) / 2
+        schedule = evaluation.build_schedule(inputs={b}, outputs={c})
+        self.assertLen(schedule.steps, 2)
+        np.testing.assert_array_equal(
+            c.run({b: evset}).get_index_value(()).features[0],
+            (evset.get_index_value(()).features[0] / 0.5) / 2,
+        )
+
+    def test_schedule_no_fold_scalar(self):
+        a = tp.input_node([("f", tp.float64)])
+        b = tp.input_node([("f", tp.int64)])
+
+        # Floating point subtractions are not associative.
+        schedule = evaluation.build_schedule(
+            inputs={a}, outputs={(a - 1.0) - 2.0}
+        )
+        self.assertLen(schedule.steps, 2)
+
+        # Floating point divisions can overflow or lose precision on small
+        # values, even by powers of two.
+        schedule = evaluation.build_schedule(inputs={a}, outputs={(a / 2) / 4})
+        self.assertLen(schedule.steps, 2)
+
+        # Division by a value other than a power of two is not exact.
+        schedule = evaluation.build_schedule(inputs={b}, outputs={(b / 3) / 2})
+        self.assertLen(schedule.steps, 2)
+
+        # Dividing by a power of two smaller than one can overflow.
+        schedule = evaluation.build_schedule(
+            inputs={b}, outputs={(b / 2) / 0.25}
+        )
+        self.assertLen(schedule.steps, 2)
+
+        # The merged divisor is too large.
+        schedule = evaluation.build_schedule(
+            inputs={b}, outputs={(b / 2**40) / 2**40}
+        )
+        self.assertLen(schedule.steps, 2)
+
+        # The merged value does not fit in the feature dtype.
+        schedule = evaluation.build_schedule(
+            inputs={b}, outputs={(b - 2**62) - 2**62}
+        )
+        self.assertLen(schedule.steps, 2)
+
+        # The first value does not fit in the feature dtype.
+        b32 = tp.input_node([("f", tp.int32)])
+        schedule = evaluation.build_schedule(
+            inputs={b32}, outputs={(b32 - 2**40) - (-(2**40))}
+        )
+        self.assertLen(schedule.steps, 2)
+
+        # The intermediate result is used by another operator.
+        c = b - 1
+        schedule = evaluation.build_schedule(inputs={b}, outputs={c - 2, c})
+        self.assertLen(schedule.steps, 2)
+
 
 if __name__ == "__main__":
     absltest.main()
@@ -541,9 +541,12 @@ class MagicMethodsTest(absltest.TestCase):
     def test_division_scalar(
         self, float_1: EventSetNodeOrEvset, int_1: EventSetNodeOrEvset, **kwargs
     ):
-        # Shouldn't work: divide int node
-        with self.assertRaises(ValueError):
-            out = int_1 / 3
+        # Should work: divide int node, with a float output
+        out = int_1 / 3
+        self.assertTrue(isinstance(out.creator, DivideScalarOperator))
+        self.assertTrue(
+            all(f.dtype == DType.FLOAT64 for f in out.schema.features)
+        )
 
         # Should work: float node and int scalar
         out = float_1 / 3
@@ -555,9 +558,12 @@ class MagicMethodsTest(absltest.TestCase):
     def test_right_division_scalar(
         self, float_1: EventSetNodeOrEvset, int_1: EventSetNodeOrEvset, **kwargs
     ):
-        # Shouldn't work: divide by int node
-        with self.assertRaises(ValueError):
-            out = 3 / int_1
+        # Should work: divide by int node, with a float output
+        out = 3 / int_1
+        self.assertTrue(isinstance(out.creator, DivideScalarOperator))
+        self.assertTrue(
+            all(f.dtype == DType.FLOAT64 for f in out.schema.features)
+        )
 
         # Should work: divide by float node
         out = 3 / float_1
@@ -136,10 +136,23 @@ class IndexData:
         if not isinstance(other, IndexData):
             return False
 
-        if not np.array_equal(self.timestamps, other.timestamps):
+        if len(self.features) != len(other.features):
+            return False
+
+        # Note: IndexData with the same sampling share the same timestamps.
+        if self.timestamps is not other.timestamps and not np.array_equal(
+            self.timestamps, other.timestamps
+        ):
             return False
 
         for f1, f2 in zip(self.features, other.features):
+            # Cheap checks that don't read the feature values.
+            if f1 is f2:
+                continue
+            # Note: String features of different widths can be equal.
+            if f1.shape != f2.shape or f1.dtype.kind != f2.dtype.kind:
+                return False
+
             if f1.dtype.kind == "f":
                 if not np.allclose(f1, f2, equal_nan=True):
                     return False
@@ -44,6 +44,44 @@ class EventSetTest(absltest.TestCase):
         self.evset.set_index_value((2, b"world"), modified)
         self.assertEqual(self.evset.get_index_value((2, b"world")), modified)
 
+    def test_index_data_equality(self):
+        timestamps = np.array([1.0, 2.0])
+        index_data = IndexData(
+            features=[np.array([1.0, np.nan]), np.array([b"a", b"b"])],
+            timestamps=timestamps,
+        )
+
+        # Same timestamps object, equal features.
+        self.assertEqual(
+            index_data,
+            IndexData(
+                features=[np.array([1.0, np.nan]), np.array([b"a", b"b"])],
+                timestamps=timestamps,
+            ),
+        )
+        # Different features shape.
+        self.assertNotEqual(
+            index_data,
+            IndexData(
+                features=[np.array([1.0]), np.array([b"a", b"b"])],
+                timestamps=timestamps,
+            ),
+        )
+        # Different number of features.
+        self.assertNotEqual(
+            index_data,
+            IndexData(
+                features=[np.array([1.0, np.nan])], timestamps=timestamps
+            ),
+        )
+        # Different timestamps.
+        self.assertNotEqual(
+            index_data,
+            IndexData(
+                features=index_data.features, timestamps=np.array([1.0, 3.0])
+            ),
+        )
+
     def test_data_access(self):
         self.assertEqual(
             repr(self.evset.schema.features), "[('a', int64), ('b', int64)]"
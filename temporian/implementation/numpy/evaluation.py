@@ -65,6 +65,11 @@ def run_schedule(
         # Instantiate implementation
         implementation = implementation_cls(step.op)
 
+        if implementation.can_reuse_input() and _is_reusable(
+            step.op.inputs["input"], schedule
+        ):
+            implementation.enable_input_reuse()
+
         if verbose == 1:
             print(
                 f"    {step_idx+1} / {num_steps}: {step.op.operator_key()}",
@@ -144,3 +149,19 @@ def run_schedule(
                 )
 
     return data
+
+
+def _is_reusable(node: EventSetNode, schedule: Schedule) -> bool:
+    """Checks if the feature arrays of a node can be overwritten by its only
+    consumer.
+
+    The feature arrays of the node should not be shared with any other node.
+    """
+
+    if node not in schedule.single_use_nodes or node.creator is None:
+        return False
+
+    creator_implementation_cls = implementation_lib.get_implementation_class(
+        node.creator.definition.key
+    )
+    return creator_implementation_cls.allocates_output_features()
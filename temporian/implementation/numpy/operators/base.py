@@ -19,10 +19,37 @@ class OperatorImplementation(ABC):
         self._operator = operator
         # TODO: Check operator type
 
+        # If true, the output can be written in the feature arrays of the
+        # "input" input.
+        self._reuse_input = False
+
     @property
     def operator(self):
         return self._operator
 
+    @classmethod
+    def allocates_output_features(cls) -> bool:
+        """Checks if the output feature arrays are always newly allocated,
+        i.e., never shared with the inputs. Optionally implemented."""
+
+        return False
+
+    def can_reuse_input(self) -> bool:
+        """Checks if the output can be written in the feature arrays of the
+        "input" input. Optionally implemented."""
+
+        return False
+
+    def enable_input_reuse(self) -> None:
+        """Allows the output to be written in the feature arrays of the
+        "input" input.
+
+        Should only be called if the input data is not used anywhere else.
+        """
+
+        assert self.can_reuse_input()
+        self._reuse_input = True
+
     def call(self, **inputs: EventSet) -> Dict[str, EventSet]:
         """Like __call__, but with checks."""
 
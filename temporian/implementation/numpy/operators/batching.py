@@ -0,0 +1,192 @@
+# Copyright 2021 Google LLC.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Utilities to apply element-wise operations on all the features and index
+keys of an EventSet at once, or on the index keys in parallel."""
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Iterable, List, Optional, Tuple, TypeVar
+
+import numpy as np
+
+from temporian.core.data.dtype import DType
+from temporian.implementation.numpy.data.event_set import EventSet
+
+# Maximum average number of events per index key for which the features and
+# index keys are batched together. Above this value, the cost of the
+# concatenation is larger than the per-array overhead it saves.
+MAX_AVERAGE_INDEX_SIZE = 64
+
+# Minimum number of feature arrays (i.e. number of index keys times number of
+# features) per feature dtype for which the features and index keys are
+# batched together. Below this value, the cost of the concatenation and split
+# is larger than the per-array overhead it saves.
+MIN_BATCH_NUM_ARRAYS = 16
+
+# Minimum number of index keys and events for which the index keys are
+# processed in parallel. Below those values, the thread dispatch overhead is
+# larger than the time spent in numpy.
+MIN_PARALLEL_INDEX_KEYS = 8
+MIN_PARALLEL_NUM_EVENTS = 100_000
+
+_T = TypeVar("_T")
+_R = TypeVar("_R")
+
+# Number of CPUs, read once instead of for each operator call.
+_cpu_count: int = os.cpu_count() or 1
+
+# Thread pool shared by all the operators. Created on first use.
+_thread_pool: Optional[ThreadPoolExecutor] = None
+
+
+def _reset_after_fork() -> None:
+    """Discards the state inherited from the parent process.
+
+    The worker threads are not copied by `os.fork()`, so the inherited pool
+    would never run the submitted tasks.
+    """
+
+    global _cpu_count, _thread_pool
+    _cpu_count = os.cpu_count() or 1
+    _thread_pool = None
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
+
+
+def use_batching(evset: EventSet) -> bool:
+    """Checks if an element-wise operation on `evset` should be batched.
+
+    Element-wise operations on EventSets with many small feature arrays (i.e.
+    many features or many small index keys) are dominated by the per-array
+    numpy call overhead. In this case, it is faster to concatenate the arrays,
+    run the operation once, and split the result.
+    """
+
+    index_data = evset.get_arbitrary_index_data()
+    if index_data is None:
+        return False
+
+    # The arrays of each dtype are concatenated together, and the operation
+    # runs once per dtype.
+    num_index_keys = len(evset.data)
+    num_dtypes = len({feature.dtype for feature in evset.schema.features})
+    num_arrays = num_index_keys * len(index_data.features)
+    if num_arrays < MIN_BATCH_NUM_ARRAYS * num_dtypes:
+        return False
+
+    if not all(feature.dtype.kind in "biuf" for feature in index_data.features):
+        # Concatenating string features changes their width.
+        return False
+
+    num_events = sum(len(data.timestamps) for data in evset.data.values())
+    return num_events <= MAX_AVERAGE_INDEX_SIZE * num_index_keys
+
+
+def use_parallel(evset: EventSet) -> bool:
+    """Checks if an element-wise operation on `evset` should process the
+    index keys in parallel.
+
+    Numpy releases the GIL during element-wise operations on numerical
+    arrays, so index keys with large feature arrays can be processed by
+    several threads at the same time.
+    """
+
+    if len(evset.data) < MIN_PARALLEL_INDEX_KEYS or _cpu_count < 2:
+        return False
+
+    num_events = sum(len(data.timestamps) for data in evset.data.values())
+    return num_events >= MIN_PARALLEL_NUM_EVENTS
+
+
+def parallel_map(fn: Callable[[_T], _R], items: Iterable[_T]) -> List[_R]:
+    """Applies `fn` to each item using the shared thread pool.
+
+    The results are returned in the order of `items`.
+    """
+
+    global _thread_pool
+    if _thread_pool is None:
+        _thread_pool = ThreadPoolExecutor(max_workers=_cpu_count)
+    return list(_thread_pool.map(fn, items))
+
+
+class FeatureBatch:
+    """Layout of the features of an EventSet concatenated together.
+
+    Features with the same dtype are concatenated together, and for each
+    feature, the index keys are concatenated in the order of `evset.data`.
+
+    Attributes:
+        index_keys: Index keys in the order of concatenation.
+        groups: Dtype and indices of the features concatenated together.
+    """
+
+    def __init__(self, evset: EventSet, dtypes: List[DType]) -> None:
+        self.index_keys = list(evset.data.keys())
+
+        offsets = [0]
+        for index_data in evset.data.values():
+            offsets.append(offsets[-1] + len(index_data.timestamps))
+        self._offsets = offsets
+
+        feature_idxs_per_dtype: Dict[DType, List[int]] = {}
+        for feature_idx, dtype in enumerate(dtypes):
+            feature_idxs_per_dtype.setdefault(dtype, []).append(feature_idx)
+        self.groups: List[Tuple[DType, List[int]]] = list(
+            feature_idxs_per_dtype.items()
+        )
+        self._num_features = len(dtypes)
+
+    def concatenate(
+        self, evset: EventSet, feature_idxs: List[int]
+    ) -> np.ndarray:
+        """Concatenates the values of features over all the index keys."""
+
+        all_index_data = [
+            evset.data[index_key] for index_key in self.index_keys
+        ]
+        return np.concatenate(
+            [
+                index_data.features[feature_idx]
+                for feature_idx in feature_idxs
+                for index_data in all_index_data
+            ]
+        )
+
+    def split(self, values: List[np.ndarray]) -> List[List[np.ndarray]]:
+        """Splits concatenated features back into per-index-key features.
+
+        Args:
+            values: Concatenated features for each item in `groups`.
+
+        Returns:
+            For each index key, the list of features. The returned arrays are
+            views into `values`.
+        """
+
+        num_events = self._offsets[-1]
+        features: List[np.ndarray] = [None] * self._num_features  # type: ignore
+        for (_, feature_idxs), group_values in zip(self.groups, values):
+            for position, feature_idx in enumerate(feature_idxs):
+                begin = position * num_events
+                features[feature_idx] = group_values[begin : begin + num_events]
+
+        offsets = self._offsets
+        return [
+            [feature[begin:end] for feature in features]
+            for begin, end in zip(offsets[:-1], offsets[1:])
+        ]
@@ -58,7 +58,7 @@ class SubtractNumpyImplementation(BaseBinaryNumpyImplementation):
         evset_2_feature: np.ndarray,
         dtype: DType,
     ) -> np.ndarray:
-        return evset_1_feature - evset_2_feature
+        return np.subtract(evset_1_feature, evset_2_feature)
 
 
 class MultiplyNumpyImplementation(BaseBinaryNumpyImplementation):
@@ -90,14 +90,8 @@ class DivideNumpyImplementation(BaseBinaryNumpyImplementation):
         evset_2_feature: np.ndarray,
         dtype: DType,
     ) -> np.ndarray:
-        if evset_1_feature.dtype in [DType.INT32, DType.INT64]:
-            raise ValueError(
-                "Cannot use the divide operator on feature "
-                f"{evset_1_feature} of type {evset_1_feature.dtype.type}. "
-                "Cast to a floating point type or use "
-                "floordiv operator (//) instead, on these integer types."
-            )
-        return evset_1_feature / evset_2_feature
+        # Note: Integer features are rejected by DivideOperator.
+        return np.divide(evset_1_feature, evset_2_feature)
 
 
 class FloorDivNumpyImplementation(BaseBinaryNumpyImplementation):
@@ -11,7 +11,7 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-from typing import Dict
+from typing import Dict, List, Tuple
 from abc import abstractmethod
 
 import numpy as np
@@ -21,6 +21,10 @@ from temporian.core.operators.binary.base import BaseBinaryOperator
 from temporian.implementation.numpy.data.event_set import IndexData
 from temporian.implementation.numpy.data.event_set import EventSet
 from temporian.implementation.numpy.operators.base import OperatorImplementation
+from temporian.implementation.numpy.operators.batching import (
+    parallel_map,
+    use_parallel,
+)
 
 
 class BaseBinaryNumpyImplementation(OperatorImplementation):
@@ -28,6 +32,10 @@ class BaseBinaryNumpyImplementation(OperatorImplementation):
         super().__init__(operator)
         assert isinstance(operator, BaseBinaryOperator)
 
+    @classmethod
+    def allocates_output_features(cls) -> bool:
+        return True
+
     @abstractmethod
     def _do_operation(
         self,
@@ -59,31 +67,33 @@ class BaseBinaryNumpyImplementation(OperatorImplementation):
             raise ValueError(
                 "Both EventSets must have the same number of features."
             )
-        num_features = len(input_1.schema.features)
+        dtypes = [feature.dtype for feature in input_1.schema.features]
+        do_operation = self._do_operation
 
         # create destination EventSet
         dst_evset = EventSet(data={}, schema=output_schema)
 
         assert len(input_1.data) == len(input_2.data)
 
-        for index_key, index_data in input_1.data.items():
+        def compute_features(index_key: Tuple) -> List[np.ndarray]:
             # iterate over index key features
-            input_1_features = index_data.features
-            input_2_features = input_2.data[index_key].features
-            dst_features = []
-
-            for feature_idx in range(num_features):
-                input_1_feature = input_1_features[feature_idx]
-                input_2_feature = input_2_features[feature_idx]
-                assert input_1_feature.dtype.type == input_2_feature.dtype.type
-
-                result = self._do_operation(
-                    input_1_feature,
-                    input_2_feature,
-                    input_1.schema.features[feature_idx].dtype,
+            return [
+                do_operation(input_1_feature, input_2_feature, dtype)
+                for input_1_feature, input_2_feature, dtype in zip(
+                    input_1.data[index_key].features,
+                    input_2.data[index_key].features,
+                    dtypes,
                 )
-                dst_features.append(result)
+            ]
+
+        if use_parallel(input_1):
+            all_features = parallel_map(compute_features, input_1.data.keys())
+        else:
+            all_features = map(compute_features, input_1.data.keys())
 
+        for (index_key, index_data), dst_features in zip(
+            input_1.data.items(), all_features
+        ):
             dst_evset.set_index_value(
                 index_key,
                 IndexData(
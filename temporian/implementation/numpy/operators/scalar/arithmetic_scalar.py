@@ -11,7 +11,7 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-from typing import Union
+from typing import Optional, Union
 
 import numpy as np
 
@@ -28,8 +28,27 @@ from temporian.core.operators.scalar import (
     ModuloScalarOperator,
     PowerScalarOperator,
 )
+from temporian.core.operators.scalar.arithmetic_scalar import (
+    power_of_two_exponent,
+)
 from temporian.implementation.numpy import implementation_lib
 
+# Largest exponent of a power of two divisor replaced by a multiplication. The
+# divisor and its reciprocal are exactly representable as normal float32 and
+# float64 values.
+_MAX_RECIPROCAL_EXPONENT = 64
+
+
+def _exact_reciprocal(value: Union[float, int]) -> Optional[float]:
+    """Gets the reciprocal of `value` if multiplying by it is exact.
+
+    Returns None if `x * (1 / value)` can differ from `x / value`.
+    """
+    exponent = power_of_two_exponent(value)
+    if exponent is None or abs(exponent) > _MAX_RECIPROCAL_EXPONENT:
+        return None
+    return 1.0 / value
+
 
 class AddScalarNumpyImplementation(BaseScalarNumpyImplementation):
     """Numpy implementation of the add scalar operator."""
@@ -46,16 +65,36 @@ class AddScalarNumpyImplementation(BaseScalarNumpyImplementation):
 class SubtractScalarNumpyImplementation(BaseScalarNumpyImplementation):
     """Numpy implementation of the subtract scalar operator."""
 
+    def __init__(self, operator: SubtractScalarOperator) -> None:
+        super().__init__(operator)
+        assert isinstance(operator, SubtractScalarOperator)
+        self._is_value_first = operator.is_value_first
+
+    def can_reuse_input(self) -> bool:
+        # The output features have the same dtype as the input features.
+        return True
+
     def _do_operation(
         self,
         feature: np.ndarray,
         value: Union[float, int, str, bool],
         dtype: DType,
     ) -> np.ndarray:
-        if self._operator.is_value_first:
-            return value - feature
-
-        return feature - value
+        # Note: The ufunc writes the result directly in the output array
+        # (either a new array or the input array if it can be reused), and the
+        # scalar is broadcasted by numpy without being materialized. The input
+        # array is only reused if it can hold the result without casting it
+        # (e.g. an int32 feature minus a value out of the int32 range).
+        out = None
+        if (
+            self._reuse_input
+            and np.result_type(feature, value) == feature.dtype
+        ):
+            out = feature
+        if self._is_value_first:
+            return np.subtract(value, feature, out=out)
+
+        return np.subtract(feature, value, out=out)
 
 
 class MultiplyScalarNumpyImplementation(BaseScalarNumpyImplementation):
@@ -73,16 +112,30 @@ class MultiplyScalarNumpyImplementation(BaseScalarNumpyImplementation):
 class DivideScalarNumpyImplementation(BaseScalarNumpyImplementation):
     """Numpy implementation of the divide scalar operator."""
 
+    def __init__(self, operator: DivideScalarOperator) -> None:
+        super().__init__(operator)
+        assert isinstance(operator, DivideScalarOperator)
+        self._is_value_first = operator.is_value_first
+
+        # Multiplications are cheaper than divisions. Dividing by a power of
+        # two gives the same result as multiplying by its reciprocal.
+        self._reciprocal: Optional[float] = None
+        if not operator.is_value_first:
+            self._reciprocal = _exact_reciprocal(operator.value)
+
     def _do_operation(
         self,
         feature: np.ndarray,
         value: Union[float, int, str, bool],
         dtype: DType,
     ) -> np.ndarray:
-        if self._operator.is_value_first:
-            return value / feature
+        if self._is_value_first:
+            return np.divide(value, feature)
+
+        if self._reciprocal is not None:
+            return np.multiply(feature, self._reciprocal)
 
-        return feature / value
+        return np.divide(feature, value)
 
 
 class FloorDivideScalarNumpyImplementation(BaseScalarNumpyImplementation):
@@ -11,7 +11,7 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-from typing import Dict, Union
+from typing import Dict, List, Union
 from abc import ABC, abstractmethod
 
 import numpy as np
@@ -22,12 +22,22 @@ from temporian.core.operators.scalar.base import (
 )
 from temporian.implementation.numpy.data.event_set import EventSet, IndexData
 from temporian.implementation.numpy.operators.base import OperatorImplementation
+from temporian.implementation.numpy.operators.batching import (
+    FeatureBatch,
+    parallel_map,
+    use_batching,
+    use_parallel,
+)
 
 
 class BaseScalarNumpyImplementation(OperatorImplementation, ABC):
     def __init__(self, operator: BaseScalarOperator) -> None:
         super().__init__(operator)
 
+    @classmethod
+    def allocates_output_features(cls) -> bool:
+        return True
+
     @abstractmethod
     def _do_operation(
         self,
@@ -51,21 +61,55 @@ class BaseScalarNumpyImplementation(OperatorImplementation, ABC):
         assert isinstance(self.operator, BaseScalarOperator)
         output_schema = self.output_schema("output")
 
+        # Loop invariants, resolved once instead of for each index key.
+        value = self.operator.value
+        dtypes = [feature.dtype for feature in input.schema.features]
+        do_operation = self._do_operation
+
         dst_evset = EventSet(data={}, schema=output_schema)
-        for index_key, index_data in input.data.items():
+
+        if use_batching(input):
+            # Run the operation once per dtype on all the features and index
+            # keys.
+            batch = FeatureBatch(input, dtypes)
+            results = [
+                do_operation(
+                    batch.concatenate(input, feature_idxs), value, dtype
+                )
+                for dtype, feature_idxs in batch.groups
+            ]
+            for index_key, features in zip(
+                batch.index_keys, batch.split(results)
+            ):
+                dst_evset.set_index_value(
+                    index_key,
+                    IndexData(
+                        features,
+                        input.data[index_key].timestamps,
+                        schema=output_schema,
+                    ),
+                    normalize=False,
+                )
+            return {"output": dst_evset}
+
+        def compute_features(index_data: IndexData) -> List[np.ndarray]:
+            return [
+                do_operation(feature, value, dtype)
+                for feature, dtype in zip(index_data.features, dtypes)
+            ]
+
+        if use_parallel(input):
+            all_features = parallel_map(compute_features, input.data.values())
+        else:
+            all_features = map(compute_features, input.data.values())
+
+        for (index_key, index_data), features in zip(
+            input.data.items(), all_features
+        ):
             dst_evset.set_index_value(
                 index_key,
                 IndexData(
-                    [
-                        self._do_operation(
-                            feature,
-                            self.operator.value,
-                            input.schema.features[feature_idx].dtype,
-                        )
-                        for feature_idx, feature in enumerate(
-                            index_data.features
-                        )
-                    ],
+                    features,
                     index_data.timestamps,
                     schema=output_schema,
                 ),